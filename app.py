@@ -1,37 +1,84 @@
 import os
-import shutil
 import pdfplumber
 import json
 import re
-import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+# Transactions of interest are matched with one precompiled,
+# case-insensitive pattern instead of lowercasing every cell.
+HITACHI_PATTERN = re.compile(r"hitachi", re.IGNORECASE)
+
+# Field patterns per bank, compiled once at module load rather than
+# on every PDF.
+CBI_PATTERNS = {
+    "Branch_Name": re.compile(r"Branch Code :(.+)"),
+    "Account_Holder": re.compile(r"M/S (.+)"),
+    "Account_Number": re.compile(r"Account Number :(.+)"),
+    "IFSC_Code": re.compile(r"IFSC :(.+)"),
+    "Cleared_Balance": re.compile(r"Cleared Balance :(.+)")
+}
+
+CUB_PATTERNS = {
+    "Branch_Name": re.compile(r"Bank Branch\s*:\s*(.+)"),
+    "Account_Holder": re.compile(r"Account Name\s*:\s*(.+)"),
+    "Account_Number": re.compile(r"Account Number\s*:\s*(\d+)"),
+    "IFSC_Code": re.compile(r"IFSC Code\s*:\s*([A-Z]{4}0[A-Z0-9]{6})"),
+    "Cleared_Balance": re.compile(r"Cleared Balance\s*:\s*([\d,]+\.\d+)")
+}
+
+CRGB_PATTERNS = {
+    "Branch_Name": re.compile(r"Your Branch\s*:\s*(.+)"),
+    "Account_Holder": re.compile(r"Account Holder\s*:\s*(.+)"),
+    "Account_Number": re.compile(r"Account No.\s*:\s*(\d+)"),
+    "IFSC_Code": re.compile(r"IFSC code\s*:\s*([A-Z]{4}0[A-Z0-9]{6})"),
+    "Cleared_Balance": re.compile(r"Cleared Balance\s*:\s*([\d,]+\.\d+)")
+}
+
+# Captures day, numeric or abbreviated month, and 2- or 4-digit year
+# in one pass, covering dd/mm/yyyy, dd-mm-yy, 01-SEP-22 and the like.
+DATE_PATTERN = re.compile(r"^(\d{1,2})[/-](\d{1,2}|[A-Za-z]{3})[/-](\d{2,4})$")
+
+MONTH_ABBREVIATIONS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
 
 # Utility Functions
 def convert_date_to_d_mm_yyyy(date_str):
     """
-    Attempt to parse the date from common formats (dd/mm/yyyy, dd-mm-yyyy, etc.)
-    and return it in 'dd-mm-yyyy' format (e.g., '01-09-2022').
+    Attempt to parse the date from common formats (dd/mm/yyyy, dd-mm-yyyy,
+    dd-MMM-yy, etc.) and return it in 'dd-mm-yyyy' format (e.g., '01-09-2022').
     If parsing fails, return the original string.
     """
     date_str = date_str.strip()
-    possible_formats = [
-        "%d/%m/%Y", "%d-%m-%Y",
-        "%d/%m/%y", "%d-%m-%y",
-        "%d-%b-%y",  # e.g., "01-SEP-22"
-        "%d-%b-%Y"   # e.g., "01-SEP-2022"
-    ]
-    for fmt in possible_formats:
-        try:
-            dt = datetime.datetime.strptime(date_str, fmt)
-            # Output format: dd-mm-yyyy (e.g., '01-09-2022')
-            return dt.strftime("%d-%m-%Y")
-        except ValueError:
-            pass
-    # If none of the formats matched, return the original string
-    return date_str
+    match = DATE_PATTERN.match(date_str)
+    if not match:
+        # The string is not a recognizable date; return it unchanged
+        return date_str
+
+    day, month, year = match.groups()
+    if month.isdigit():
+        month = int(month)
+    else:
+        month = MONTH_ABBREVIATIONS.get(month.lower())
+        if month is None:
+            return date_str
+
+    day = int(day)
+    year = int(year)
+    if year < 100:
+        # Two-digit years: statements from 1970-1999 vs 2000-2069
+        year += 2000 if year < 70 else 1900
+
+    if not (1 <= day <= 31 and 1 <= month <= 12):
+        return date_str
+
+    # Output format: dd-mm-yyyy (e.g., '01-09-2022')
+    return f"{day:02d}-{month:02d}-{year:04d}"
 
 def extract_pattern(text, pattern):
-    """Helper function to extract text using regex."""
-    match = re.search(pattern, text)
+    """Helper function to extract text using a compiled regex."""
+    match = pattern.search(text)
     return match.group(1).strip() if match else None
 
 def generate_response(data, transactions):
@@ -56,136 +103,144 @@ def generate_response(data, transactions):
 class BankParser:
     def __init__(self):
         self.parsers = {}
+        self._detector = None
 
     def register_parser(self, bank_name, parser_function):
         """Register a dedicated parser for a specific bank."""
         self.parsers[bank_name.lower()] = parser_function
+        self._detector = None  # Rebuild the detector on next parse
+
+    def _detect_bank(self, first_page_text):
+        """Find a registered bank name in the text with one scan."""
+        if self._detector is None:
+            # One case-insensitive alternation over all registered names
+            # matches in a single pass instead of one substring search
+            # (and one .lower() of the page text) per bank.
+            self._detector = re.compile(
+                "|".join(re.escape(name) for name in self.parsers),
+                re.IGNORECASE
+            )
+        match = self._detector.search(first_page_text)
+        return match.group(0).lower() if match else None
 
     def parse(self, pdf_path):
         """Determine the bank type and invoke the corresponding parser."""
         with pdfplumber.open(pdf_path) as pdf:
             first_page_text = pdf.pages[0].extract_text()
 
-            # Identify the bank using keywords in the first page
-            for bank_name, parser_function in self.parsers.items():
-                if bank_name.lower() in first_page_text.lower():
-                    return parser_function(pdf_path)
+            # Identify the bank using keywords in the first page and
+            # hand the open PDF to its parser so the layout analysis
+            # is not paid a second time.
+            bank_name = self._detect_bank(first_page_text)
+            if bank_name:
+                return self.parsers[bank_name](pdf)
 
         # If no parser is found, raise an exception
         raise ValueError("Bank type not recognized. Add a parser for this format.")
 
 # Parser Implementations
-def central_bank_of_india_parser(pdf_path):
+def central_bank_of_india_parser(pdf):
     """Parser for Central Bank of India."""
     data = {}
     transactions = []
 
-    with pdfplumber.open(pdf_path) as pdf:
-        first_page_text = pdf.pages[0].extract_text()
-
-        # Extract data
-        data["Bank_Name"] = "Central Bank of India"
-        data["Branch_Name"] = extract_pattern(first_page_text, r"Branch Code :(.+)")
-        data["Account_Holder"] = extract_pattern(first_page_text, r"M/S (.+)")
-        data["Account_Number"] = extract_pattern(first_page_text, r"Account Number :(.+)")
-        data["IFSC_Code"] = extract_pattern(first_page_text, r"IFSC :(.+)")
-        data["Cleared_Balance"] = extract_pattern(first_page_text, r"Cleared Balance :(.+)")
-
-        # Extract transactions
-        for page in pdf.pages:
-            table = page.extract_table()
-            if table:
-                for row in table[1:]:
-                    if len(row) >= 5 and "hitachi" in row[4].lower():
-                        post_date = row[0].strip() if row[0] else ""
-                        value_date = row[1].strip() if row[1] else ""
-                        formatted_post_date = convert_date_to_d_mm_yyyy(post_date)
-                        formatted_value_date = convert_date_to_d_mm_yyyy(value_date)
-
-                        transactions.append({
-                            "Post Date": formatted_post_date,
-                            "Value Date": formatted_value_date,
-                            "Branch Code": row[2].strip() if row[2] else "",
-                            "Cheque Number": row[3].strip() if row[3] else "",
-                            "Description": row[4].strip() if row[4] else "",
-                            "Debit": row[5].strip() if len(row) > 5 and row[5] else "",
-                            "Credit": row[6].strip() if len(row) > 6 and row[6] else "",
-                            "Balance": row[7].strip() if len(row) > 7 and row[7] else ""
-                        })
+    first_page_text = pdf.pages[0].extract_text()
+
+    # Extract data
+    data["Bank_Name"] = "Central Bank of India"
+    for field, pattern in CBI_PATTERNS.items():
+        data[field] = extract_pattern(first_page_text, pattern)
+
+    # Extract transactions
+    for page in pdf.pages:
+        table = page.extract_table()
+        if table:
+            for row in table[1:]:
+                if len(row) >= 5 and row[4] and HITACHI_PATTERN.search(row[4]):
+                    post_date = row[0].strip() if row[0] else ""
+                    value_date = row[1].strip() if row[1] else ""
+                    formatted_post_date = convert_date_to_d_mm_yyyy(post_date)
+                    formatted_value_date = convert_date_to_d_mm_yyyy(value_date)
+
+                    transactions.append({
+                        "Post Date": formatted_post_date,
+                        "Value Date": formatted_value_date,
+                        "Branch Code": row[2].strip() if row[2] else "",
+                        "Cheque Number": row[3].strip() if row[3] else "",
+                        "Description": row[4].strip() if row[4] else "",
+                        "Debit": row[5].strip() if len(row) > 5 and row[5] else "",
+                        "Credit": row[6].strip() if len(row) > 6 and row[6] else "",
+                        "Balance": row[7].strip() if len(row) > 7 and row[7] else ""
+                    })
+        page.flush_cache()
 
     return generate_response(data, transactions)
 
-def city_union_bank_parser(pdf_path):
+def city_union_bank_parser(pdf):
     """Parser for City Union Bank."""
     data = {}
     transactions = []
 
-    with pdfplumber.open(pdf_path) as pdf:
-        first_page_text = pdf.pages[0].extract_text()
-
-        # Extract data
-        data["Bank_Name"] = "City Union Bank"
-        data["Branch_Name"] = extract_pattern(first_page_text, r"Bank Branch\s*:\s*(.+)")
-        data["Account_Holder"] = extract_pattern(first_page_text, r"Account Name\s*:\s*(.+)")
-        data["Account_Number"] = extract_pattern(first_page_text, r"Account Number\s*:\s*(\d+)")
-        data["IFSC_Code"] = extract_pattern(first_page_text, r"IFSC Code\s*:\s*([A-Z]{4}0[A-Z0-9]{6})")
-        data["Cleared_Balance"] = extract_pattern(first_page_text, r"Cleared Balance\s*:\s*([\d,]+\.\d+)")
-
-        # Extract transactions
-        for page in pdf.pages:
-            table = page.extract_table()
-            if table:
-                for row in table[1:]:  # Skip the header row
-                    if len(row) >= 6 and "hitachi" in row[1].lower():
-                        original_date = row[0].strip() if row[0] else ""
-                        formatted_date = convert_date_to_d_mm_yyyy(original_date)
-
-                        transactions.append({
-                            "Date": formatted_date,
-                            "Description": row[1].strip() if row[1] else "",
-                            "Cheque": row[2].strip() if row[2] else "",
-                            "Debit": row[3].strip() if row[3] else "",
-                            "Credit": row[4].strip() if row[4] else "",
-                            "Balance": row[5].strip() if row[5] else ""
-                        })
+    first_page_text = pdf.pages[0].extract_text()
+
+    # Extract data
+    data["Bank_Name"] = "City Union Bank"
+    for field, pattern in CUB_PATTERNS.items():
+        data[field] = extract_pattern(first_page_text, pattern)
+
+    # Extract transactions
+    for page in pdf.pages:
+        table = page.extract_table()
+        if table:
+            for row in table[1:]:  # Skip the header row
+                if len(row) >= 6 and row[1] and HITACHI_PATTERN.search(row[1]):
+                    original_date = row[0].strip() if row[0] else ""
+                    formatted_date = convert_date_to_d_mm_yyyy(original_date)
+
+                    transactions.append({
+                        "Date": formatted_date,
+                        "Description": row[1].strip() if row[1] else "",
+                        "Cheque": row[2].strip() if row[2] else "",
+                        "Debit": row[3].strip() if row[3] else "",
+                        "Credit": row[4].strip() if row[4] else "",
+                        "Balance": row[5].strip() if row[5] else ""
+                    })
+        page.flush_cache()
 
     return generate_response(data, transactions)
 
-def chhattisgarh_rajya_gramin_bank_parser(pdf_path):
+def chhattisgarh_rajya_gramin_bank_parser(pdf):
     """Parser for Chhattisgarh Rajya Gramin Bank."""
     data = {}
     transactions = []
 
-    with pdfplumber.open(pdf_path) as pdf:
-        first_page_text = pdf.pages[0].extract_text()
-
-        # Extract data
-        data["Bank_Name"] = "Chhattisgarh Rajya Gramin Bank"
-        data["Branch_Name"] = extract_pattern(first_page_text, r"Your Branch\s*:\s*(.+)")
-        data["Account_Holder"] = extract_pattern(first_page_text, r"Account Holder\s*:\s*(.+)")
-        data["Account_Number"] = extract_pattern(first_page_text, r"Account No.\s*:\s*(\d+)")
-        data["IFSC_Code"] = extract_pattern(first_page_text, r"IFSC code\s*:\s*([A-Z]{4}0[A-Z0-9]{6})")
-        data["Cleared_Balance"] = extract_pattern(first_page_text, r"Cleared Balance\s*:\s*([\d,]+\.\d+)")
-
-        # Extract transactions
-        for page in pdf.pages:
-            table = page.extract_table()
-            if table:
-                for row in table[1:]:  # Skip the header row
-                    if len(row) >= 6 and "hitachi" in row[2].lower():
-                        post_date = row[0].strip() if row[0] else ""
-                        value_date = row[1].strip() if row[1] else ""
-                        formatted_post_date = convert_date_to_d_mm_yyyy(post_date)
-                        formatted_value_date = convert_date_to_d_mm_yyyy(value_date)
-
-                        transactions.append({
-                            "Post Date": formatted_post_date,
-                            "Value Date": formatted_value_date,
-                            "Description": row[2].strip() if row[2] else "",
-                            "Debit": row[3].strip() if row[3] else "",
-                            "Credit": row[4].strip() if row[4] else "",
-                            "Balance": row[5].strip() if row[5] else ""
-                        })
+    first_page_text = pdf.pages[0].extract_text()
+
+    # Extract data
+    data["Bank_Name"] = "Chhattisgarh Rajya Gramin Bank"
+    for field, pattern in CRGB_PATTERNS.items():
+        data[field] = extract_pattern(first_page_text, pattern)
+
+    # Extract transactions
+    for page in pdf.pages:
+        table = page.extract_table()
+        if table:
+            for row in table[1:]:  # Skip the header row
+                if len(row) >= 6 and row[2] and HITACHI_PATTERN.search(row[2]):
+                    post_date = row[0].strip() if row[0] else ""
+                    value_date = row[1].strip() if row[1] else ""
+                    formatted_post_date = convert_date_to_d_mm_yyyy(post_date)
+                    formatted_value_date = convert_date_to_d_mm_yyyy(value_date)
+
+                    transactions.append({
+                        "Post Date": formatted_post_date,
+                        "Value Date": formatted_value_date,
+                        "Description": row[2].strip() if row[2] else "",
+                        "Debit": row[3].strip() if row[3] else "",
+                        "Credit": row[4].strip() if row[4] else "",
+                        "Balance": row[5].strip() if row[5] else ""
+                    })
+        page.flush_cache()
 
     return generate_response(data, transactions)
 
@@ -195,6 +250,35 @@ def register_default_parsers(parser_framework):
     parser_framework.register_parser("City Union Bank", city_union_bank_parser)
     parser_framework.register_parser("Chhattisgarh Rajya Gramin Bank", chhattisgarh_rajya_gramin_bank_parser)
 
+# Worker Function
+_worker_framework = None
+
+def _get_parser_framework():
+    """Lazily build one BankParser per worker process."""
+    global _worker_framework
+    if _worker_framework is None:
+        _worker_framework = BankParser()
+        register_default_parsers(_worker_framework)
+    return _worker_framework
+
+def process_single_pdf(pdf_path, output_json_path, success_path):
+    """Parse one PDF, save its JSON and move it to the success folder."""
+    parser_framework = _get_parser_framework()
+    file_name = os.path.basename(pdf_path)
+
+    try:
+        # Parse the PDF
+        parsed_data = parser_framework.parse(pdf_path)
+        # Save as JSON
+        with open(output_json_path, 'w') as json_file:
+            json.dump(parsed_data, json_file, indent=4)
+
+        # Move successfully parsed PDF to success folder; os.replace is
+        # a single atomic rename, safe with concurrent workers
+        os.replace(pdf_path, success_path)
+    except ValueError as e:
+        print(f"Failed to parse {file_name}: {e}")
+
 # Main Function
 def main(input_folder, success_folder, output_json_folder):
     if not os.path.exists(success_folder):
@@ -203,30 +287,28 @@ def main(input_folder, success_folder, output_json_folder):
     if not os.path.exists(output_json_folder):
         os.makedirs(output_json_folder)
 
-    parser_framework = BankParser()
-    register_default_parsers(parser_framework)
-
-    for file_name in os.listdir(input_folder):
-        if file_name.lower().endswith('.pdf'):
-            pdf_path = os.path.join(input_folder, file_name)
-            json_file_name = f"{os.path.splitext(file_name)[0]}.json"
-            output_json_path = os.path.join(output_json_folder, json_file_name)
-
-            try:
-                # Parse the PDF
-                parsed_data = parser_framework.parse(pdf_path)
-                # Save as JSON
-                with open(output_json_path, 'w') as json_file:
-                    json.dump(parsed_data, json_file, indent=4)
-                
-                # Move successfully parsed PDF to success folder
-                shutil.move(pdf_path, os.path.join(success_folder, file_name))
-            except ValueError as e:
-                print(f"Failed to parse {file_name}: {e}")
+    jobs = []
+    # os.scandir streams DirEntry objects with the joined path and
+    # file type already available, avoiding per-entry path joins.
+    with os.scandir(input_folder) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith('.pdf'):
+                json_file_name = f"{os.path.splitext(entry.name)[0]}.json"
+                output_json_path = os.path.join(output_json_folder, json_file_name)
+                success_path = os.path.join(success_folder, entry.name)
+                jobs.append((entry.path, output_json_path, success_path))
+
+    # Parse PDFs in parallel; pdfplumber's layout analysis is CPU-bound,
+    # so one worker per core scales near-linearly on large batches.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(process_single_pdf, *job) for job in jobs]
+        for future in futures:
+            future.result()
 
 # Example Usage
-input_folder = './input'  # Replace with the path to your folder containing PDFs
-success_folder = './success'  # Replace with the path to your success folder
-output_json_folder = './output_json'  # Replace with the path to your output JSON folder
-main(input_folder, success_folder, output_json_folder)
+if __name__ == "__main__":
+    input_folder = './input'  # Replace with the path to your folder containing PDFs
+    success_folder = './success'  # Replace with the path to your success folder
+    output_json_folder = './output_json'  # Replace with the path to your output JSON folder
+    main(input_folder, success_folder, output_json_folder)
 